@@ -4,6 +4,8 @@ from pipelines.inference_pipeline import InferencePipeline
 from src.vectorstore.chroma_client import ChromaClient
 from src.embeddings.embedder import AnimeEmbedder
 from src.generation.llm_client import LLMClient
+from src.loadtest.trace import TraceRecorder
+from config.registry import get_config_registry
 from dotenv import load_dotenv, find_dotenv
 import os
 
@@ -21,7 +23,13 @@ def get_pipeline():
         embedding_function=embedder.get_embedding_function()
     )
     llm = LLMClient()
-    return InferencePipeline(chroma_client=chroma, llm_client=llm)
+    # Gravação opcional do tráfego real para replay no teste de carga
+    trace_path = os.getenv("TRACE_RECORD_PATH")
+    recorder = TraceRecorder(trace_path) if trace_path else None
+    pipeline = InferencePipeline(chroma_client=chroma, llm_client=llm, trace_recorder=recorder)
+    # Observa os YAMLs: ajustes de k, search_type, temperature e max_tokens sem reiniciar o pod.
+    get_config_registry().start_watching()
+    return pipeline
 
 # Inicialização de Estado
 if "session_id" not in st.session_state:
@@ -0,0 +1,200 @@
+import copy
+import hashlib
+import os
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Optional
+
+import yaml
+
+from config.schemas import parse_embeddings, parse_llm, parse_retriever
+from utils.logger import get_logger
+from utils.custom_exception import AppException
+
+
+# Parser tipado por arquivo: valida o YAML e devolve a dataclass correspondente.
+# YAMLs desconhecidos são apenas carregados como dict.
+PARSERS: Dict[str, Callable[[dict], Any]] = {
+    "embeddings.yaml": parse_embeddings,
+    "retriever.yaml": parse_retriever,
+    "llm.yaml": parse_llm,
+}
+
+
+def _make_ref(callback: Callable) -> Callable[[], Optional[Callable]]:
+    """
+    Referência fraca ao callback: métodos de instância não mantêm o objeto vivo
+    (ex: InferencePipelines descartadas após um clear do cache do Streamlit).
+    """
+    if hasattr(callback, "__self__"):
+        return weakref.WeakMethod(callback)
+    return weakref.ref(callback)
+
+
+class ConfigRegistry:
+    """
+    Registro central de configuração.
+
+    Cada YAML é lido, validado e convertido em objeto tipado (config/schemas.py)
+    uma única vez e mantido em cache. Um watcher opcional (polling por conteúdo)
+    recarrega arquivos alterados e notifica os componentes inscritos, permitindo
+    ajustar parâmetros sem reiniciar o pod. Uma mudança só é considerada aplicada
+    quando todos os inscritos a aceitam; caso contrário, a anterior permanece ativa
+    e o conteúdo recusado só é reavaliado quando o arquivo mudar novamente.
+    """
+
+    def __init__(self, poll_interval: float = 5.0):
+        self.logger = get_logger(self.__class__.__name__)
+        self.poll_interval = poll_interval
+
+        self._lock = threading.RLock()
+        self._configs: Dict[str, Any] = {}
+        self._digests: Dict[str, str] = {}
+        self._rejected: Dict[str, str] = {}
+        self._subscribers: Dict[str, List[Callable[[], Optional[Callable]]]] = {}
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(path)
+
+    def _read(self, key: str):
+        """Lê e valida o YAML, retornando (config, digest do conteúdo)."""
+        with open(key, "rb") as f:
+            raw = f.read()
+        config = yaml.safe_load(raw) or {}
+        parser = PARSERS.get(os.path.basename(key))
+        if parser:
+            config = parser(config)
+        return config, hashlib.sha256(raw).hexdigest()
+
+    def get(self, path: str) -> Any:
+        """Retorna uma cópia da configuração (carregando e validando na primeira chamada)."""
+        key = self._key(path)
+        with self._lock:
+            if key not in self._configs:
+                try:
+                    self._configs[key], self._digests[key] = self._read(key)
+                except Exception as exc:
+                    self.logger.error("Failed to load %s", os.path.basename(key))
+                    raise AppException("Configuration error", exc)
+                self.logger.info("Configuration loaded | path=%s", path)
+            return copy.deepcopy(self._configs[key])
+
+    def subscribe(self, path: str, callback: Callable[[Any], None]) -> None:
+        """
+        Registra um callback chamado com a nova configuração quando o arquivo mudar.
+        O registro guarda apenas uma referência fraca ao callback.
+        """
+        key = self._key(path)
+        self.get(path)
+        with self._lock:
+            self._subscribers.setdefault(key, []).append(_make_ref(callback))
+
+    def unsubscribe(self, path: str, callback: Callable[[Any], None]) -> None:
+        """Remove um callback registrado (e referências já coletadas pelo GC)."""
+        key = self._key(path)
+        with self._lock:
+            self._subscribers[key] = [
+                ref for ref in self._subscribers.get(key, [])
+                if ref() is not None and ref() != callback
+            ]
+
+    def _live_callbacks(self, key: str) -> List[Callable]:
+        with self._lock:
+            refs = [ref for ref in self._subscribers.get(key, []) if ref() is not None]
+            self._subscribers[key] = refs
+            return [ref() for ref in refs]
+
+    def check_for_changes(self) -> List[str]:
+        """
+        Verifica todos os arquivos em cache e aplica os que mudaram.
+        Retorna a lista de caminhos recarregados.
+        """
+        with self._lock:
+            keys = list(self._configs)
+
+        reloaded = []
+        for key in keys:
+            name = os.path.basename(key)
+            digest = self._read_digest(key)
+            with self._lock:
+                if digest is None or digest in (self._digests.get(key), self._rejected.get(key)):
+                    continue
+
+            try:
+                config, digest = self._read(key)
+            except Exception:
+                # Guarda o digest do conteúdo inválido para não repetir o erro a cada ciclo.
+                self._rejected[key] = digest
+                self.logger.error("Invalid %s ignored; keeping previous configuration", name, exc_info=True)
+                continue
+
+            callbacks = self._live_callbacks(key)
+            if not callbacks:
+                self.logger.warning("%s changed but has no live subscribers; restart to apply", name)
+
+            failed = False
+            for callback in callbacks:
+                try:
+                    callback(copy.deepcopy(config))
+                except Exception:
+                    failed = True
+                    self.logger.error("Config reload callback failed for %s", name, exc_info=True)
+
+            if failed:
+                # Como um YAML inválido: registra o conteúdo recusado e só tenta de novo
+                # quando o arquivo mudar (ex: falta de API key não se resolve sozinha).
+                self._rejected[key] = digest
+                self.logger.error(
+                    "%s not applied; previous configuration is still active until the file changes", name
+                )
+                continue
+
+            with self._lock:
+                self._configs[key], self._digests[key] = config, digest
+                self._rejected.pop(key, None)
+            reloaded.append(key)
+        return reloaded
+
+    @staticmethod
+    def _read_digest(key: str) -> Optional[str]:
+        try:
+            with open(key, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.check_for_changes()
+
+    def start_watching(self) -> None:
+        """Inicia o watcher em background (idempotente)."""
+        with self._lock:
+            if self._watcher and self._watcher.is_alive():
+                return
+            self._stop.clear()
+            self._watcher = threading.Thread(target=self._watch, name="config-watcher", daemon=True)
+            self._watcher.start()
+        self.logger.info("Watching configuration files | interval=%.1fs", self.poll_interval)
+
+    def stop_watching(self) -> None:
+        self._stop.set()
+        if self._watcher:
+            self._watcher.join()
+            self._watcher = None
+
+
+_registry: Optional[ConfigRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_config_registry() -> ConfigRegistry:
+    """Retorna a instância única do registro, compartilhada por todo o processo."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ConfigRegistry(poll_interval=float(os.getenv("CONFIG_POLL_INTERVAL", "5")))
+        return _registry
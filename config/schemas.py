@@ -0,0 +1,182 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Optional
+
+
+SUPPORTED_SEARCH_TYPES = {"similarity", "mmr", "similarity_score_threshold"}
+SUPPORTED_LATENCY_DISTRIBUTIONS = {"constant", "uniform", "normal", "lognormal"}
+LATENCY_MS_KEYS = {"mean_ms", "stddev_ms", "min_ms", "max_ms"}
+
+
+def _require(condition: bool, message: str) -> None:
+    if not condition:
+        raise ValueError(message)
+
+
+def _build(cls, raw: Optional[dict], where: str):
+    """Instancia a dataclass a partir do dict do YAML, rejeitando chaves desconhecidas."""
+    _require(isinstance(raw, dict), f"{where} must be a mapping")
+    unknown = set(raw) - {f.name for f in fields(cls)}
+    _require(not unknown, f"{where} has unknown keys: {sorted(unknown)}")
+    try:
+        return cls(**raw)
+    except TypeError as exc:
+        raise ValueError(f"{where}: {exc}") from exc
+
+
+def _positive_int(value: Any, where: str) -> None:
+    _require(isinstance(value, int) and value > 0, f"{where} must be a positive integer")
+
+
+# --- embeddings.yaml ---
+
+@dataclass(frozen=True)
+class EmbeddingProviderConfig:
+    model_name: str
+    # huggingface
+    device: str = "cpu"
+    encode_kwargs: Dict[str, Any] = field(default_factory=dict)
+    # openai
+    dimensions: Optional[int] = None
+    base_url: Optional[str] = None
+    batch_size: int = 256
+    max_tokens_per_batch: int = 250_000
+    max_input_tokens: int = 8191
+    max_workers: int = 4
+    max_retries: int = 6
+    backoff_base: float = 1.0
+    backoff_max: float = 60.0
+    timeout: float = 60.0
+
+    def __post_init__(self):
+        if self.dimensions is not None:
+            _positive_int(self.dimensions, "dimensions")
+        for name in ("batch_size", "max_tokens_per_batch", "max_input_tokens", "max_workers"):
+            _positive_int(getattr(self, name), name)
+
+
+@dataclass(frozen=True)
+class EmbeddingsConfig:
+    default_provider: str
+    providers: Dict[str, EmbeddingProviderConfig]
+
+    @property
+    def active(self) -> EmbeddingProviderConfig:
+        return self.providers[self.default_provider]
+
+
+def parse_embeddings(raw: dict) -> EmbeddingsConfig:
+    providers = {
+        name: _build(EmbeddingProviderConfig, conf, f"providers.{name}")
+        for name, conf in (raw.get("providers") or {}).items()
+    }
+    provider = raw.get("default_provider")
+    _require(provider in providers, f"default_provider '{provider}' not found in providers")
+    return EmbeddingsConfig(default_provider=provider, providers=providers)
+
+
+# --- retriever.yaml ---
+
+@dataclass(frozen=True)
+class RetrieverSettings:
+    search_type: str
+    search_kwargs: Dict[str, Any]
+
+    def __post_init__(self):
+        _require(
+            self.search_type in SUPPORTED_SEARCH_TYPES,
+            f"search_type must be one of {sorted(SUPPORTED_SEARCH_TYPES)}",
+        )
+        _positive_int((self.search_kwargs or {}).get("k"), "search_kwargs.k")
+
+
+@dataclass(frozen=True)
+class RetrieverConfig:
+    default_type: str
+    settings: Dict[str, RetrieverSettings]
+
+    @property
+    def active(self) -> RetrieverSettings:
+        return self.settings[self.default_type]
+
+
+def parse_retriever(raw: dict) -> RetrieverConfig:
+    settings = {
+        name: _build(RetrieverSettings, conf, f"settings.{name}")
+        for name, conf in (raw.get("settings") or {}).items()
+    }
+    default_type = raw.get("default_type", "similarity")
+    _require(default_type in settings, f"default_type '{default_type}' not found in settings")
+    return RetrieverConfig(default_type=default_type, settings=settings)
+
+
+# --- llm.yaml ---
+
+@dataclass(frozen=True)
+class LLMModelConfig:
+    name: str
+    temperature: float
+    max_tokens: int
+
+    def __post_init__(self):
+        _require(
+            isinstance(self.temperature, (int, float)) and 0 <= self.temperature <= 2,
+            "model.temperature must be a number between 0 and 2",
+        )
+        _positive_int(self.max_tokens, "model.max_tokens")
+
+
+@dataclass(frozen=True)
+class LLMRequestConfig:
+    timeout: float = 30
+    retries: int = 2
+
+
+@dataclass(frozen=True)
+class LLMProviderConfig:
+    model: LLMModelConfig
+    request: LLMRequestConfig = field(default_factory=LLMRequestConfig)
+    # Apenas para o provedor 'stub' (testes de carga offline)
+    latency: Dict[str, Any] = field(default_factory=dict)
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        latency = self.latency or {}
+        unknown = set(latency) - LATENCY_MS_KEYS - {"distribution"}
+        _require(not unknown, f"latency has unknown keys: {sorted(unknown)}")
+        _require(
+            latency.get("distribution", "constant") in SUPPORTED_LATENCY_DISTRIBUTIONS,
+            f"latency.distribution must be one of {sorted(SUPPORTED_LATENCY_DISTRIBUTIONS)}",
+        )
+        for key in LATENCY_MS_KEYS & set(latency):
+            _require(
+                isinstance(latency[key], (int, float)) and latency[key] >= 0,
+                f"latency.{key} must be a non-negative number",
+            )
+        if "min_ms" in latency and "max_ms" in latency:
+            _require(latency["min_ms"] <= latency["max_ms"], "latency.min_ms must not exceed latency.max_ms")
+        _require(
+            isinstance(self.error_rate, (int, float)) and 0 <= self.error_rate <= 1,
+            "error_rate must be a number between 0 and 1",
+        )
+
+
+@dataclass(frozen=True)
+class LLMConfig:
+    default_provider: str
+    providers: Dict[str, LLMProviderConfig]
+
+
+def parse_llm(raw: dict) -> LLMConfig:
+    providers = {}
+    for name, conf in (raw.get("providers") or {}).items():
+        where = f"providers.{name}"
+        _require(isinstance(conf, dict), f"{where} must be a mapping")
+        conf = dict(conf)
+        conf["model"] = _build(LLMModelConfig, conf.get("model"), f"{where}.model")
+        if "request" in conf:
+            conf["request"] = _build(LLMRequestConfig, conf["request"], f"{where}.request")
+        providers[name] = _build(LLMProviderConfig, conf, where)
+    provider = raw.get("default_provider")
+    _require(provider in providers, f"default_provider '{provider}' not found in providers")
+    return LLMConfig(default_provider=provider, providers=providers)
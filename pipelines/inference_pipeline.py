@@ -1,10 +1,15 @@
-from typing import Dict
+import threading
+import time
+from typing import Dict, Optional
 from langchain_core.chat_history import InMemoryChatMessageHistory
 from langchain_core.runnables.history import RunnableWithMessageHistory
 
 from src.vectorstore.chroma_client import ChromaClient
 from src.retrieval.retriever import AnimeRetriever
 from src.generation.llm_client import LLMClient
+from src.loadtest.trace import TraceRecorder
+from config.registry import get_config_registry
+from config.schemas import LLMConfig, RetrieverConfig
 from utils.logger import get_logger
 from utils.custom_exception import AppException
 
@@ -15,33 +20,54 @@ class InferencePipeline:
     de conversas isolado por sessão na RAM.
     """
 
-    def __init__(self, chroma_client: ChromaClient, llm_client: LLMClient):
+    def __init__(
+        self,
+        chroma_client: ChromaClient,
+        llm_client: LLMClient,
+        trace_recorder: Optional[TraceRecorder] = None,
+    ):
         """
         Inicializa a pipeline com injeção de dependências.
+
+        Se 'trace_recorder' for informado, cada requisição é gravada em JSONL
+        para posterior replay pelo teste de carga.
         """
         self.logger = get_logger(self.__class__.__name__)
         self.llm_client = llm_client
+        self.trace_recorder = trace_recorder
         
         # AnimeRetriever busca as configurações no retriever.yaml automaticamente.
-        self.retriever = AnimeRetriever(chroma_client).get_retriever()
+        self.anime_retriever = AnimeRetriever(chroma_client)
+        self.retriever = self.anime_retriever.get_retriever()
         
         # 2. Obtém a base da Chain (esteira de processamento)
         self.base_chain = self.llm_client.get_chain(self.retriever)
         
         # 3. Gerenciador de Memória Local (Dicionário na RAM)
         self.session_store: Dict[str, InMemoryChatMessageHistory] = {}
+        self._session_lock = threading.Lock()
         
         # 4. Cria a Chain Final com suporte a histórico
-        self.runnable_chain = self._setup_history_chain()
+        self.runnable_chain = self._setup_history_chain(self.base_chain)
+
+        # 5. Hot reload: mudanças no retriever.yaml/llm.yaml reconstroem só as
+        # runnables afetadas; embedder e banco de vetores permanecem carregados.
+        # O registro guarda referências fracas: a pipeline pode ser coletada pelo GC.
+        self._reload_lock = threading.Lock()
+        registry = get_config_registry()
+        registry.subscribe(self.anime_retriever.config_path, self._on_retriever_config_change)
+        registry.subscribe(self.llm_client.config_path, self._on_llm_config_change)
 
     def _get_session_history(self, session_id: str) -> InMemoryChatMessageHistory:
         """Recupera ou cria um histórico para uma sessão específica."""
-        if session_id not in self.session_store:
-            self.logger.info("Creating new chat session | session_id=%s", session_id)
-            self.session_store[session_id] = InMemoryChatMessageHistory()
-        return self.session_store[session_id]
+        # Lock: requisições concorrentes da mesma sessão devem compartilhar o histórico.
+        with self._session_lock:
+            if session_id not in self.session_store:
+                self.logger.info("Creating new chat session | session_id=%s", session_id)
+                self.session_store[session_id] = InMemoryChatMessageHistory()
+            return self.session_store[session_id]
 
-    def _setup_history_chain(self):
+    def _setup_history_chain(self, base_chain):
         """
         Envolve a chain base com lógica de histórico de mensagens.
         
@@ -49,12 +75,40 @@ class InferencePipeline:
         para gerenciar automaticamente a entrada/saída de memória na chain.
         """
         return RunnableWithMessageHistory(
-            self.base_chain,
+            base_chain,
             get_session_history=self._get_session_history,
             input_messages_key="question",
             history_messages_key="chat_history",
         )
 
+    def _swap_chain(self, retriever) -> None:
+        """
+        Monta a nova chain completa e só então a publica.
+        Requisições em andamento terminam com a chain antiga; as novas já usam a atual.
+        """
+        base_chain = self.llm_client.get_chain(retriever)
+        runnable_chain = self._setup_history_chain(base_chain)
+        self.retriever, self.base_chain, self.runnable_chain = retriever, base_chain, runnable_chain
+
+    def _on_retriever_config_change(self, config: RetrieverConfig) -> None:
+        start = time.perf_counter()
+        with self._reload_lock:
+            self._swap_chain(self.anime_retriever.get_retriever(config))
+        self.logger.info("Retriever config reloaded | latency=%.1fms", (time.perf_counter() - start) * 1000)
+
+    def _on_llm_config_change(self, config: LLMConfig) -> None:
+        start = time.perf_counter()
+        with self._reload_lock:
+            self.llm_client.reload(config)
+            self._swap_chain(self.retriever)
+        self.logger.info("LLM config reloaded | latency=%.1fms", (time.perf_counter() - start) * 1000)
+
+    def close(self) -> None:
+        """Cancela a inscrição no hot reload (ex: antes de descartar a pipeline)."""
+        registry = get_config_registry()
+        registry.unsubscribe(self.anime_retriever.config_path, self._on_retriever_config_change)
+        registry.unsubscribe(self.llm_client.config_path, self._on_llm_config_change)
+
     def predict(self, query: str, session_id: str = "default_user") -> str:
         """
         Executa a inferência completa para uma pergunta do usuário.
@@ -65,6 +119,9 @@ class InferencePipeline:
         """
         try:
             self.logger.info("Processing query | session=%s", session_id)
+
+            if self.trace_recorder:
+                self.trace_recorder.record(query, session_id)
             
             # Executa a esteira (Chain) com o ID da sessão
             response = self.runnable_chain.invoke(
@@ -0,0 +1,117 @@
+from src.embeddings.embedder import AnimeEmbedder
+from src.vectorstore.chroma_client import ChromaClient
+from src.generation.llm_client import LLMClient
+from src.loadtest.trace import load_trace
+from src.loadtest.targets import PipelineTarget, HttpTarget
+from src.loadtest.load_generator import LoadGenerator
+from pipelines.inference_pipeline import InferencePipeline
+from utils.logger import get_logger
+from utils.custom_exception import AppException
+from dotenv import load_dotenv, find_dotenv
+from typing import Optional
+import argparse
+import json
+import os
+
+
+class LoadTestPipeline:
+    """
+    Pipeline de teste de carga: faz o replay de um trace JSONL contra a
+    InferencePipeline (in-process) ou contra um endpoint HTTP, e gera um
+    relatório de vazão, latência, erros e crescimento de memória.
+    """
+
+    def __init__(
+        self,
+        trace_path: str,
+        vector_db_path: str = "chroma_db",
+        target_url: Optional[str] = None,
+        llm_provider: Optional[str] = "stub",
+        speedup: float = 1.0,
+        rate: Optional[float] = None,
+        max_workers: int = 64,
+        report_path: Optional[str] = None,
+    ):
+        self.logger = get_logger(self.__class__.__name__)
+        self.trace_path = trace_path
+        self.vector_db_path = vector_db_path
+        self.target_url = target_url
+        self.llm_provider = llm_provider
+        self.speedup = speedup
+        self.rate = rate
+        self.max_workers = max_workers
+        self.report_path = report_path
+
+    def _build_target(self):
+        """Seleciona o alvo: HTTP remoto, ou a pipeline local (por padrão com LLM stub, offline)."""
+        if self.target_url:
+            self.logger.info("Using HTTP target | url=%s", self.target_url)
+            return HttpTarget(self.target_url)
+
+        self.logger.info("Using in-process target | llm_provider=%s", self.llm_provider)
+        embedder = AnimeEmbedder()
+        chroma = ChromaClient(self.vector_db_path, embedder.get_embedding_function())
+        llm = LLMClient(provider=self.llm_provider)
+        return PipelineTarget(InferencePipeline(chroma_client=chroma, llm_client=llm))
+
+    def run(self) -> dict:
+        """
+        Executa o replay do trace e retorna o relatório (opcionalmente salvo em JSON).
+        """
+        try:
+            self.logger.info("Starting the Load Test Pipeline...")
+
+            records = load_trace(self.trace_path)
+            target = self._build_target()
+            try:
+                generator = LoadGenerator(
+                    target,
+                    speedup=self.speedup,
+                    rate=self.rate,
+                    max_workers=self.max_workers,
+                )
+                report = generator.run(records)
+            finally:
+                if hasattr(target, "close"):
+                    target.close()
+
+            if self.report_path:
+                with open(self.report_path, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=2)
+                self.logger.info("Load test report saved | path=%s", self.report_path)
+
+            summary = {k: v for k, v in report.items() if k not in ("memory", "client_memory")}
+            self.logger.info("Load test summary | %s", json.dumps(summary))
+            self.logger.info("Load Test Pipeline finished successfully!")
+            return report
+
+        except Exception as exc:
+            self.logger.error("Load Test Pipeline failed at some stage")
+            raise AppException("Critical failure in load test pipeline", exc)
+
+
+if __name__ == "__main__":
+
+    load_dotenv(find_dotenv())
+
+    parser = argparse.ArgumentParser(description="Replay de traces JSONL contra o recomendador")
+    parser.add_argument("trace", help="Arquivo JSONL com query, session_id e timestamp")
+    parser.add_argument("--url", help="Endpoint HTTP externo (padrão: InferencePipeline local)")
+    parser.add_argument("--provider", default="stub", help="Provedor LLM do alvo local (padrão: stub)")
+    parser.add_argument("--speedup", type=float, default=1.0, help="Acelera o tempo do trace")
+    parser.add_argument("--rate", type=float, help="Taxa fixa em req/s (ignora timestamps)")
+    parser.add_argument("--max-workers", type=int, default=64, help="Requisições simultâneas em voo")
+    parser.add_argument("--report", help="Caminho do relatório JSON de saída")
+    args = parser.parse_args()
+
+    pipeline = LoadTestPipeline(
+        trace_path=args.trace,
+        vector_db_path=os.getenv("VECTOR_DB_PATH", "chroma_db"),
+        target_url=args.url,
+        llm_provider=args.provider,
+        speedup=args.speedup,
+        rate=args.rate,
+        max_workers=args.max_workers,
+        report_path=args.report,
+    )
+    pipeline.run()
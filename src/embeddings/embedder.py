@@ -1,8 +1,9 @@
-import yaml
 import os
 from typing import List
 from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_openai import OpenAIEmbeddings 
+from src.embeddings.openai_batched import BatchedOpenAIEmbeddings
+from config.registry import get_config_registry
+from config.schemas import EmbeddingsConfig
 from utils.logger import get_logger
 from utils.custom_exception import AppException
 
@@ -13,37 +14,40 @@ class AnimeEmbedder:
 
     def __init__(self, config_path: str = "config/embeddings.yaml"):
         self.logger = get_logger(self.__class__.__name__)
-        self.config = self._load_config(config_path)
+        # Leitura e validação centralizadas (cache compartilhado no processo).
+        self.config: EmbeddingsConfig = get_config_registry().get(config_path)
         self.embedding_model = self._setup_embeddings()
 
-    def _load_config(self, path: str) -> dict:
-        """Carrega as configurações do YAML."""
-        try:
-            with open(path, "r") as f:
-                return yaml.safe_load(f)
-        except Exception as exc:
-            self.logger.error("Failed to load embeddings.yaml")
-            raise AppException("Configuration error", exc)
-
     def _setup_embeddings(self):
         """
         Fábrica de Embeddings: Instancia o provedor baseado no default_provider do YAML.
         """
-        provider_name = self.config.get("default_provider")
-        conf = self.config["providers"][provider_name]
+        provider_name = self.config.default_provider
+        conf = self.config.active
         
         self.logger.info("Initializing Embedding provider | provider=%s", provider_name)
 
         if provider_name == "huggingface":
             return HuggingFaceEmbeddings(
-                model_name=conf["model_name"],
-                model_kwargs={'device': conf.get("device", "cpu")},
-                encode_kwargs=conf.get("encode_kwargs", {})
+                model_name=conf.model_name,
+                model_kwargs={'device': conf.device},
+                encode_kwargs=conf.encode_kwargs
             )
         elif provider_name == "openai":
-            return OpenAIEmbeddings(
-                model=conf["model_name"],
-                api_key=os.getenv("OPENAI_API_KEY")
+            # Wrapper próprio: lote por tokens, requisições paralelas e backoff em 429.
+            return BatchedOpenAIEmbeddings(
+                model=conf.model_name,
+                dimensions=conf.dimensions,
+                api_key=os.getenv("OPENAI_API_KEY"),
+                base_url=conf.base_url or os.getenv("OPENAI_BASE_URL"),
+                batch_size=conf.batch_size,
+                max_tokens_per_batch=conf.max_tokens_per_batch,
+                max_input_tokens=conf.max_input_tokens,
+                max_workers=conf.max_workers,
+                max_retries=conf.max_retries,
+                backoff_base=conf.backoff_base,
+                backoff_max=conf.backoff_max,
+                timeout=conf.timeout
             )
         else:
             raise AppException(f"Unsupported embedding provider: {provider_name}")
@@ -0,0 +1,209 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import openai
+import tiktoken
+from langchain_core.embeddings import Embeddings
+from utils.logger import get_logger
+from utils.custom_exception import AppException
+
+
+# Erros transitórios que justificam nova tentativa (429, timeouts e 5xx).
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+class BatchedOpenAIEmbeddings(Embeddings):
+    """
+    Embeddings da OpenAI com controle de lote, concorrência e backoff.
+
+    - Empacota os textos em lotes limitados por quantidade e por tokens.
+    - Envia vários lotes em paralelo (max_workers requisições em voo).
+    - Repete lotes que falham com 429/5xx usando backoff exponencial com jitter,
+      respeitando o header Retry-After quando presente.
+    - Repassa 'dimensions' à API (vetores menores => índice menor).
+    - Trunca textos acima do contexto do modelo (max_input_tokens), como o
+      OpenAIEmbeddings faz, em vez de deixar a API rejeitar o lote.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        dimensions: Optional[int] = None,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        batch_size: int = 256,
+        max_tokens_per_batch: int = 250_000,
+        max_input_tokens: int = 8191,
+        max_workers: int = 4,
+        max_retries: int = 6,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        timeout: float = 60.0,
+    ):
+        self.logger = get_logger(self.__class__.__name__)
+        self.model = model
+        self.dimensions = dimensions
+        self.batch_size = batch_size
+        self.max_tokens_per_batch = max_tokens_per_batch
+        self.max_input_tokens = max_input_tokens
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        # O retry interno do SDK é desligado: o backoff é controlado aqui, por lote.
+        self.client = openai.OpenAI(
+            api_key=api_key or os.getenv("OPENAI_API_KEY"),
+            base_url=base_url,
+            max_retries=0,
+            timeout=timeout,
+        )
+        self.encoding = self._load_encoding(model)
+
+    def _load_encoding(self, model: str):
+        """
+        Carrega o tokenizer do modelo. O tiktoken baixa o BPE na primeira execução;
+        sem rede (ex: testes com servidor stub), usa-se a estimativa por caracteres.
+        """
+        try:
+            try:
+                return tiktoken.encoding_for_model(model)
+            except KeyError:
+                return tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            self.logger.warning("tiktoken encoding unavailable, estimating tokens from text length")
+            return None
+
+    def _count_tokens(self, text: str) -> int:
+        if self.encoding is None:
+            # Estimativa conservadora (~3 caracteres por token em texto misto).
+            return len(text) // 3 + 1
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def _truncate(self, text: str) -> Tuple[str, int]:
+        """
+        Corta o texto no limite de contexto do modelo (max_input_tokens).
+        Retorna (texto, nº de tokens) para que o texto seja tokenizado uma única vez.
+        """
+        if self.encoding is None:
+            n_tokens = self._count_tokens(text)
+            if n_tokens <= self.max_input_tokens:
+                return text, n_tokens
+            self.logger.warning(
+                "Text exceeds model context, truncating | max_input_tokens=%d", self.max_input_tokens
+            )
+            # Inverso de _count_tokens: mantém a estimativa dentro do limite.
+            text = text[: (self.max_input_tokens - 1) * 3]
+            return text, self._count_tokens(text)
+
+        tokens = self.encoding.encode(text, disallowed_special=())
+        if len(tokens) <= self.max_input_tokens:
+            return text, len(tokens)
+        self.logger.warning(
+            "Text exceeds model context, truncating | max_input_tokens=%d", self.max_input_tokens
+        )
+        return self.encoding.decode(tokens[: self.max_input_tokens]), self.max_input_tokens
+
+    def _pack_batches(self, token_counts: List[int]) -> List[List[int]]:
+        """
+        Agrupa índices de textos em lotes respeitando batch_size e max_tokens_per_batch,
+        a partir da contagem de tokens de cada texto (já truncado).
+        """
+        batches, current, current_tokens = [], [], 0
+        for i, n_tokens in enumerate(token_counts):
+            if current and (
+                len(current) >= self.batch_size
+                or current_tokens + n_tokens > self.max_tokens_per_batch
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(i)
+            current_tokens += n_tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    def _retry_delay(self, attempt: int, exc: Exception) -> float:
+        """Usa o Retry-After do servidor se existir; caso contrário, backoff exponencial com jitter."""
+        response = getattr(exc, "response", None)
+        if response is not None:
+            try:
+                return min(float(response.headers.get("retry-after")), self.backoff_max)
+            except (TypeError, ValueError):
+                pass
+        delay = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+        return random.uniform(delay / 2, delay)
+
+    def _embed_batch(self, batch: List[str], abort: Optional[threading.Event] = None) -> List[List[float]]:
+        """
+        Envia um lote com retry. Se 'abort' for sinalizado (outro lote falhou),
+        desiste durante o backoff em vez de continuar tentando.
+        """
+        kwargs = {"model": self.model, "input": batch}
+        if self.dimensions:
+            kwargs["dimensions"] = self.dimensions
+        abort = abort or threading.Event()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.embeddings.create(**kwargs)
+                return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+            except RETRYABLE_ERRORS as exc:
+                if attempt == self.max_retries or abort.is_set():
+                    raise
+                delay = self._retry_delay(attempt, exc)
+                self.logger.warning(
+                    "Embedding request failed, retrying | error=%s, attempt=%d, delay=%.2fs",
+                    type(exc).__name__, attempt + 1, delay
+                )
+                if abort.wait(delay):
+                    raise
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Gera embeddings em lotes concorrentes, preservando a ordem de entrada."""
+        if not texts:
+            return []
+
+        truncated = [self._truncate(text) for text in texts]
+        texts = [text for text, _ in truncated]
+        batches = self._pack_batches([n_tokens for _, n_tokens in truncated])
+        self.logger.info(
+            "Embedding documents | texts=%d, batches=%d, max_workers=%d, dimensions=%s",
+            len(texts), len(batches), self.max_workers, self.dimensions
+        )
+
+        start = time.perf_counter()
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        abort = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = [
+                (indices, pool.submit(self._embed_batch, [texts[i] for i in indices], abort))
+                for indices in batches
+            ]
+            for indices, future in futures:
+                for i, vector in zip(indices, future.result()):
+                    results[i] = vector
+        except Exception as exc:
+            # Falha rápida: cancela lotes na fila e interrompe os backoffs em andamento.
+            abort.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            self.logger.error("OpenAI batch embedding failed")
+            raise AppException("Failed to generate OpenAI embeddings", exc)
+        finally:
+            pool.shutdown(wait=False)
+
+        self.logger.info("Documents embedded | elapsed=%.2fs", time.perf_counter() - start)
+        return results
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_batch([self._truncate(text)[0]])[0]
@@ -0,0 +1,143 @@
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.logger import get_logger
+
+
+def _fake_vector(text: str, dimensions: int) -> list:
+    """Vetor determinístico derivado do hash do texto (mesmo texto => mesmo vetor)."""
+    rng = random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+    return [rng.uniform(-1, 1) for _ in range(dimensions)]
+
+
+class StubEmbeddingsServer:
+    """
+    Servidor HTTP local compatível com POST /v1/embeddings da OpenAI.
+
+    Permite testar o BatchedOpenAIEmbeddings sem rede: simula latência,
+    responde 429 com Retry-After (nas primeiras N requisições e/ou a uma taxa
+    configurável) e registra o número de requisições e o pico de concorrência.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        latency_ms: float = 50.0,
+        rate_limit_prob: float = 0.0,
+        rate_limit_first: int = 0,
+        retry_after: float = 0.1,
+        default_dimensions: int = 1536,
+    ):
+        self.logger = get_logger(self.__class__.__name__)
+        self.latency_ms = latency_ms
+        self.rate_limit_prob = rate_limit_prob
+        self.rate_limit_first = rate_limit_first
+        self.retry_after = retry_after
+        self.default_dimensions = default_dimensions
+
+        self.stats = {"requests": 0, "rate_limited": 0, "in_flight": 0, "max_in_flight": 0}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                server.logger.debug(format, *args)
+
+            def _send_json(self, status: int, body: dict, headers: dict = None):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/embeddings"):
+                    self._send_json(404, {"error": {"message": "Not found"}})
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length) or b"{}")
+                inputs = request.get("input", [])
+                if isinstance(inputs, str):
+                    inputs = [inputs]
+
+                with server._lock:
+                    server.stats["requests"] += 1
+                    server.stats["in_flight"] += 1
+                    server.stats["max_in_flight"] = max(server.stats["max_in_flight"], server.stats["in_flight"])
+                    # As primeiras N requisições sempre recebem 429 (comportamento determinístico em testes).
+                    forced_429 = server.stats["requests"] <= server.rate_limit_first
+                try:
+                    if forced_429 or random.random() < server.rate_limit_prob:
+                        with server._lock:
+                            server.stats["rate_limited"] += 1
+                        self._send_json(
+                            429,
+                            {"error": {"message": "Rate limit reached", "type": "rate_limit_error"}},
+                            {"Retry-After": str(server.retry_after)},
+                        )
+                        return
+
+                    time.sleep(server.latency_ms / 1000.0)
+                    dimensions = request.get("dimensions") or server.default_dimensions
+                    self._send_json(200, {
+                        "object": "list",
+                        "model": request.get("model"),
+                        "data": [
+                            {"object": "embedding", "index": i, "embedding": _fake_vector(text, dimensions)}
+                            for i, text in enumerate(inputs)
+                        ],
+                        "usage": {"prompt_tokens": 0, "total_tokens": 0},
+                    })
+                finally:
+                    with server._lock:
+                        server.stats["in_flight"] -= 1
+
+        return Handler
+
+    def start(self) -> "StubEmbeddingsServer":
+        """Inicia o servidor em uma thread daemon (uso em testes)."""
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.logger.info("Stub embeddings server listening | base_url=%s", self.base_url)
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor stub de embeddings compatível com a OpenAI")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--rate-limit-prob", type=float, default=0.0)
+    parser.add_argument("--rate-limit-first", type=int, default=0, help="Responde 429 às primeiras N requisições")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Valor do header Retry-After (s)")
+    args = parser.parse_args()
+
+    stub = StubEmbeddingsServer(
+        port=args.port,
+        latency_ms=args.latency_ms,
+        rate_limit_prob=args.rate_limit_prob,
+        rate_limit_first=args.rate_limit_first,
+        retry_after=args.retry_after,
+    )
+    stub.logger.info("Stub embeddings server listening | base_url=%s", stub.base_url)
+    stub.httpd.serve_forever()
@@ -1,12 +1,15 @@
-import yaml
 import os
 from langchain_groq import ChatGroq
 from langchain_openai import ChatOpenAI
 from langchain_core.output_parsers import StrOutputParser
 from src.prompts.templates import get_anime_prompt
+from src.generation.stub_llm import StubChatModel
+from config.registry import get_config_registry
+from config.schemas import LLMConfig
 from utils.logger import get_logger
 from utils.custom_exception import AppException
 from operator import itemgetter
+from typing import Optional
 
 
 class LLMClient:
@@ -15,19 +18,32 @@ class LLMClient:
     cadeia de raciocínio (RAG Chain) usando LCEL.
     """
 
-    def __init__(self, config_path: str = "config/llm.yaml"):
+    def __init__(self, config_path: str = "config/llm.yaml", provider: Optional[str] = None):
+        """
+        Args:
+            config_path: Caminho do YAML de configuração.
+            provider: Sobrescreve o default_provider do YAML (ex: 'stub' em testes de carga).
+        """
         self.logger = get_logger(self.__class__.__name__)
-        self.config = self._load_config(config_path)
+        self.config_path = config_path
+        self.provider_override = provider
+        self.config: LLMConfig = get_config_registry().get(config_path)
+        self.provider_name = provider or self.config.default_provider
         self.llm = self._setup_llm()
 
-    def _load_config(self, path: str) -> dict:
-        """Carrega as configurações do YAML."""
+    def reload(self, config: LLMConfig) -> None:
+        """
+        Reconstrói apenas o objeto LLM com uma nova configuração (hot reload).
+        O estado atual só é substituído se a nova instância for criada com sucesso.
+        """
+        previous = (self.config, self.provider_name)
+        self.config = config
+        self.provider_name = self.provider_override or config.default_provider
         try:
-            with open(path, "r") as f:
-                return yaml.safe_load(f)
-        except Exception as exc:
-            self.logger.error("Failed to load llm.yaml")
-            raise AppException("Configuration error", exc)
+            self.llm = self._setup_llm()
+        except Exception:
+            self.config, self.provider_name = previous
+            raise
 
     def _setup_llm(self):
         """
@@ -36,25 +52,34 @@ class LLMClient:
         Centraliza a criação do objeto LLM, permitindo trocar de 
         Groq para OpenAI sem alterar os pipelines de inferência.
         """
-        provider_name = self.config.get("default_provider")
-        conf = self.config["providers"][provider_name]
+        provider_name = self.provider_name
+        if provider_name not in self.config.providers:
+            raise AppException(f"Provider not configured in llm.yaml: {provider_name}")
+        conf = self.config.providers[provider_name]
         
         self.logger.info("Initializing LLM provider | provider=%s", provider_name)
 
         if provider_name == "groq":
             return ChatGroq(
-                model_name=conf["model"]["name"],
-                temperature=conf["model"]["temperature"],
-                max_tokens=conf["model"]["max_tokens"],
+                model_name=conf.model.name,
+                temperature=conf.model.temperature,
+                max_tokens=conf.model.max_tokens,
                 api_key=os.getenv("GROQ_API_KEY")
             )
         elif provider_name == "openai":
             return ChatOpenAI(
-                model_name=conf["model"]["name"],
-                temperature=conf["model"]["temperature"],
-                max_tokens=conf["model"]["max_tokens"],
+                model_name=conf.model.name,
+                temperature=conf.model.temperature,
+                max_tokens=conf.model.max_tokens,
                 api_key=os.getenv("OPENAI_API_KEY")
             )
+        elif provider_name == "stub":
+            # Provedor offline: não faz chamadas externas, apenas simula latência.
+            return StubChatModel(
+                latency=conf.latency,
+                error_rate=conf.error_rate,
+                seed=conf.seed
+            )
         else:
             raise AppException(f"Unsupported provider: {provider_name}")
         
@@ -0,0 +1,87 @@
+import math
+import random
+import time
+from typing import Any, List, Optional
+
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import PrivateAttr
+
+
+DEFAULT_STUB_RESPONSE = (
+    "1. Title: Stub Anime\n"
+    "Synopsis: Offline placeholder answer generated by the stub provider.\n"
+    "Reason: Used only for load tests and trace replays."
+)
+
+
+def sample_latency(latency_conf: dict, rng: random.Random) -> float:
+    """
+    Sorteia uma latência (em segundos) a partir da distribuição configurada.
+
+    Distribuições suportadas: constant, uniform, normal e lognormal.
+    O valor final é sempre limitado ao intervalo [min_ms, max_ms].
+    """
+    distribution = latency_conf.get("distribution", "constant")
+    mean_ms = float(latency_conf.get("mean_ms", 0.0))
+    stddev_ms = float(latency_conf.get("stddev_ms", 0.0))
+    min_ms = float(latency_conf.get("min_ms", 0.0))
+    max_ms = float(latency_conf.get("max_ms", max(mean_ms * 10, min_ms)))
+
+    if distribution == "constant":
+        value_ms = mean_ms
+    elif distribution == "uniform":
+        value_ms = rng.uniform(min_ms, max_ms)
+    elif distribution == "normal":
+        value_ms = rng.gauss(mean_ms, stddev_ms)
+    elif distribution == "lognormal":
+        # Converte média/desvio da latência observada para os parâmetros da normal subjacente.
+        if mean_ms <= 0:
+            value_ms = 0.0
+        else:
+            sigma2 = math.log(1 + (stddev_ms ** 2) / (mean_ms ** 2))
+            mu = math.log(mean_ms) - sigma2 / 2
+            value_ms = rng.lognormvariate(mu, math.sqrt(sigma2))
+    else:
+        raise ValueError(f"Unsupported latency distribution: {distribution}")
+
+    return min(max(value_ms, min_ms), max_ms) / 1000.0
+
+
+class StubChatModel(BaseChatModel):
+    """
+    Chat model falso para execução offline (testes de carga e replay de traces).
+
+    Simula o tempo de resposta de um provedor real sorteando a latência de uma
+    distribuição configurável, e pode injetar falhas com uma taxa fixa.
+    """
+
+    response: str = DEFAULT_STUB_RESPONSE
+    latency: dict = {}
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+
+    _rng: random.Random = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._rng = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(sample_latency(self.latency, self._rng))
+
+        if self.error_rate and self._rng.random() < self.error_rate:
+            raise RuntimeError("Stub provider injected failure")
+
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=self.response))])
@@ -0,0 +1,220 @@
+import math
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from utils.logger import get_logger
+from utils.custom_exception import AppException
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil por nearest-rank sobre uma lista já ordenada."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def _current_rss_mb() -> Optional[float]:
+    """
+    Memória residente atual do processo em MB, lida de /proc (Linux).
+
+    Sem /proc não há RSS atual portável (ru_maxrss é pico e muda de unidade por
+    plataforma), então retorna None e a memória fica fora do relatório.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class LoadGenerator:
+    """
+    Gerador de carga em malha aberta (open-loop) para replay de traces.
+
+    Cada requisição é disparada no instante definido pelo trace (ou pela taxa
+    fixa), independentemente das respostas anteriores. A latência é medida a
+    partir do instante agendado, então filas internas aparecem nos percentis
+    em vez de serem escondidas por um cliente lento.
+
+    A memória amostrada é a RSS deste processo: com alvos in-process ela reflete
+    o sistema sob teste ('memory'); com alvos remotos, apenas o próprio gerador
+    ('client_memory'). Fora do Linux ela é omitida.
+    """
+
+    def __init__(
+        self,
+        target,
+        speedup: float = 1.0,
+        rate: Optional[float] = None,
+        max_workers: int = 64,
+        memory_interval: float = 1.0,
+    ):
+        """
+        Args:
+            target: Objeto com método send(query, session_id) (PipelineTarget ou HttpTarget).
+            speedup: Fator de aceleração do tempo real do trace (2.0 = duas vezes mais rápido).
+            rate: Se definido, ignora os timestamps e dispara a uma taxa fixa (req/s).
+            max_workers: Número máximo de requisições em voo simultaneamente.
+            memory_interval: Intervalo (s) entre amostras de memória.
+        """
+        if speedup <= 0:
+            raise AppException("speedup must be greater than zero")
+        if rate is not None and rate <= 0:
+            raise AppException("rate must be greater than zero")
+
+        self.logger = get_logger(self.__class__.__name__)
+        self.target = target
+        self.speedup = speedup
+        self.rate = rate
+        self.max_workers = max_workers
+        self.memory_interval = memory_interval
+        self.memory_key = "memory" if getattr(target, "in_process", False) else "client_memory"
+
+        self._lock = threading.Lock()
+        self._completed = 0
+
+    def _build_schedule(self, records: List[dict]) -> List[Tuple[float, dict]]:
+        """Converte o trace em offsets (s) relativos ao início do teste."""
+        if self.rate is not None:
+            return [(i / self.rate, record) for i, record in enumerate(records)]
+
+        if any(record["timestamp"] is None for record in records):
+            raise AppException("Trace has records without timestamp; use a fixed rate instead")
+
+        first = records[0]["timestamp"]
+        return [((record["timestamp"] - first) / self.speedup, record) for record in records]
+
+    def _execute(self, record: dict, scheduled_at: float) -> dict:
+        started_at = time.perf_counter()
+        error = None
+        try:
+            self.target.send(record["query"], record["session_id"])
+        except Exception as exc:
+            # AppException encapsula a causa real; reporta o tipo original.
+            cause = getattr(exc, "original_exception", None) or exc
+            error = type(cause).__name__
+        finished_at = time.perf_counter()
+
+        with self._lock:
+            self._completed += 1
+
+        return {
+            "latency": finished_at - scheduled_at,
+            "service_time": finished_at - started_at,
+            "queue_time": started_at - scheduled_at,
+            "error": error,
+        }
+
+    def _append_sample(self, start: float, samples: List[dict]) -> None:
+        rss_mb = _current_rss_mb()
+        if rss_mb is None:
+            return
+        with self._lock:
+            completed = self._completed
+        samples.append({
+            "elapsed_s": round(time.perf_counter() - start, 3),
+            "rss_mb": round(rss_mb, 2),
+            "completed": completed,
+        })
+
+    def _sample_memory(self, start: float, samples: List[dict], stop: threading.Event) -> None:
+        while True:
+            self._append_sample(start, samples)
+            if stop.wait(self.memory_interval):
+                break
+
+    def run(self, records: List[dict]) -> dict:
+        """
+        Executa o replay do trace e retorna o relatório de métricas.
+        """
+        if not records:
+            raise AppException("Trace is empty; nothing to replay")
+
+        schedule = self._build_schedule(records)
+        self._completed = 0
+        samples: List[dict] = []
+        stop = threading.Event()
+
+        self.logger.info(
+            "Starting load test | requests=%d, span=%.1fs, max_workers=%d",
+            len(schedule), schedule[-1][0], self.max_workers
+        )
+
+        start = time.perf_counter()
+        sampler = threading.Thread(target=self._sample_memory, args=(start, samples, stop), daemon=True)
+        sampler.start()
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for offset, record in schedule:
+                scheduled_at = start + offset
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(pool.submit(self._execute, record, scheduled_at))
+            results = [future.result() for future in futures]
+
+        duration = time.perf_counter() - start
+        stop.set()
+        sampler.join()
+        self._append_sample(start, samples)
+
+        report = self._build_report(results, duration, schedule[-1][0], samples, self.memory_key)
+        memory = report.get(self.memory_key)
+        self.logger.info(
+            "Load test finished | throughput=%.2f req/s, p50=%.0fms, p99=%.0fms, error_rate=%.2f%%, %s_growth=%s",
+            report["throughput_rps"], report["latency_ms"]["p50"], report["latency_ms"]["p99"],
+            report["error_rate"] * 100, self.memory_key,
+            f"{memory['growth_mb']:.1f}MB" if memory else "n/a"
+        )
+        return report
+
+    @staticmethod
+    def _build_report(
+        results: List[dict], duration: float, span: float, samples: List[dict], memory_key: str = "memory"
+    ) -> dict:
+        total = len(results)
+        errors = Counter(r["error"] for r in results if r["error"])
+        failed = sum(errors.values())
+
+        def summarize(key: str) -> dict:
+            values = sorted(r[key] * 1000 for r in results)
+            return {
+                "mean": round(sum(values) / len(values), 2),
+                "p50": round(_percentile(values, 50), 2),
+                "p90": round(_percentile(values, 90), 2),
+                "p95": round(_percentile(values, 95), 2),
+                "p99": round(_percentile(values, 99), 2),
+                "max": round(values[-1], 2),
+            }
+
+        report = {
+            "requests": total,
+            "succeeded": total - failed,
+            "failed": failed,
+            "error_rate": failed / total,
+            "errors": dict(errors),
+            "duration_s": round(duration, 3),
+            "offered_rps": round(total / span, 3) if span > 0 else None,
+            "throughput_rps": round((total - failed) / duration, 3) if duration > 0 else 0.0,
+            "latency_ms": summarize("latency"),
+            "service_time_ms": summarize("service_time"),
+            "queue_time_ms": summarize("queue_time"),
+        }
+
+        if samples:
+            rss_values = [s["rss_mb"] for s in samples]
+            report[memory_key] = {
+                "start_mb": rss_values[0],
+                "end_mb": rss_values[-1],
+                "peak_mb": max(rss_values),
+                "growth_mb": round(rss_values[-1] - rss_values[0], 2),
+                "timeline": samples,
+            }
+        return report
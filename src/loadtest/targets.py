@@ -0,0 +1,45 @@
+import json
+import urllib.request
+
+
+class PipelineTarget:
+    """
+    Alvo in-process: envia as requisições diretamente para a InferencePipeline.
+    """
+
+    in_process = True
+
+    def __init__(self, pipeline):
+        self.pipeline = pipeline
+
+    def send(self, query: str, session_id: str) -> str:
+        return self.pipeline.predict(query=query, session_id=session_id)
+
+    def close(self) -> None:
+        self.pipeline.close()
+
+
+class HttpTarget:
+    """
+    Alvo remoto: envia as requisições via HTTP POST com corpo JSON
+    {"query": ..., "session_id": ...}. Respostas não-2xx geram exceção.
+
+    O endpoint deve ser fornecido externamente (a aplicação Streamlit não expõe API HTTP).
+    """
+
+    in_process = False
+
+    def __init__(self, url: str, timeout: float = 60.0):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, query: str, session_id: str) -> str:
+        payload = json.dumps({"query": query, "session_id": session_id}).encode("utf-8")
+        request = urllib.request.Request(
+            self.url,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.read().decode("utf-8")
@@ -0,0 +1,84 @@
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import List, Optional
+
+from utils.logger import get_logger
+from utils.custom_exception import AppException
+
+
+def _parse_timestamp(value) -> Optional[float]:
+    """Aceita epoch (segundos) ou string ISO 8601 e retorna epoch em float."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return datetime.fromisoformat(str(value)).timestamp()
+
+
+def load_trace(path: str) -> List[dict]:
+    """
+    Lê um trace JSONL (uma requisição por linha) no formato
+    {"query": ..., "session_id": ..., "timestamp": ...}.
+
+    Retorna os registros ordenados por timestamp (quando presente).
+    """
+    logger = get_logger("TraceLoader")
+    records = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                raw = json.loads(line)
+                if "query" not in raw:
+                    raise ValueError(f"Missing 'query' field at line {line_number}")
+                records.append({
+                    "query": raw["query"],
+                    "session_id": raw.get("session_id", "default_user"),
+                    "timestamp": _parse_timestamp(raw.get("timestamp")),
+                })
+    except Exception as exc:
+        logger.error("Failed to load trace file %s", path)
+        raise AppException("Invalid trace file", exc)
+
+    if all(r["timestamp"] is not None for r in records):
+        records.sort(key=lambda r: r["timestamp"])
+
+    logger.info("Trace loaded | path=%s, requests=%d", path, len(records))
+    return records
+
+
+class TraceRecorder:
+    """
+    Grava requisições reais no mesmo formato JSONL consumido pelo LoadGenerator.
+
+    É thread-safe e abre o arquivo em modo append a cada escrita, para que o
+    trace sobreviva a reinícios do processo.
+    """
+
+    def __init__(self, path: str):
+        self.logger = get_logger(self.__class__.__name__)
+        self.path = path
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def record(self, query: str, session_id: str, timestamp: Optional[float] = None) -> None:
+        """Adiciona uma requisição ao trace. Falhas de escrita não interrompem a inferência."""
+        entry = {
+            "query": query,
+            "session_id": session_id,
+            "timestamp": timestamp if timestamp is not None else time.time(),
+        }
+        try:
+            with self._lock:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except Exception:
+            self.logger.warning("Failed to record trace entry | path=%s", self.path, exc_info=True)
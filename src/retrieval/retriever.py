@@ -1,6 +1,8 @@
-import yaml
+from typing import Optional
 from langchain_core.vectorstores import VectorStoreRetriever
 from src.vectorstore.chroma_client import ChromaClient
+from config.registry import get_config_registry
+from config.schemas import RetrieverConfig
 from utils.logger import get_logger
 from utils.custom_exception import AppException
 
@@ -15,40 +17,38 @@ class AnimeRetriever:
         """
         self.logger = get_logger(self.__class__.__name__)
         self.chroma_client = chroma_client
-        self.config = self._load_config(config_path)
+        self.config_path = config_path
+        self.config: RetrieverConfig = get_config_registry().get(config_path)
+        self._vector_store = None
 
-    def _load_config(self, path: str) -> dict:
-        """Carrega as configurações do YAML."""
-        try:
-            with open(path, "r") as f:
-                return yaml.safe_load(f)
-        except Exception as exc:
-            self.logger.error("Failed to load retriever.yaml")
-            raise AppException("Configuration error", exc)
-
-    def get_retriever(self) -> VectorStoreRetriever:
+    def get_retriever(self, config: Optional[RetrieverConfig] = None) -> VectorStoreRetriever:
         """
         Configura e retorna o objeto retriever do LangChain baseado no YAML.
+
+        Se 'config' for informado (hot reload), ele passa a ser a configuração
+        ativa; a conexão com o banco de vetores é reaproveitada.
         """
         try:
-            # 1. Identifica o tipo padrão definido no YAML (ex: similarity ou mmr)
-            default_type = self.config.get("default_type", "similarity")
-            # 2. Busca os parâmetros específicos para esse tipo
-            settings = self.config["settings"][default_type]
+            config = config if config is not None else self.config
+            # 1-2. Parâmetros do tipo padrão definido no YAML (ex: similarity ou mmr)
+            settings = config.active
             
             self.logger.info(
                 "Configuring retriever | type=%s, params=%s", 
-                default_type, settings["search_kwargs"]
+                config.default_type, settings.search_kwargs
             )
             
-            # Carrega a instância ativa do banco de vetores
-            vector_store = self.chroma_client.load_client()
+            # Carrega a instância ativa do banco de vetores (uma única vez)
+            if self._vector_store is None:
+                self._vector_store = self.chroma_client.load_client()
             
             # 3. Instancia o retriever com os argumentos injetados do YAML
-            return vector_store.as_retriever(
-                search_type=settings["search_type"],
-                search_kwargs=settings["search_kwargs"]
+            retriever = self._vector_store.as_retriever(
+                search_type=settings.search_type,
+                search_kwargs=settings.search_kwargs
             )
+            self.config = config
+            return retriever
             
         except Exception as exc:
             self.logger.error("Failed to configure dynamic LangChain retriever")
@@ -0,0 +1,135 @@
+import gc
+import shutil
+
+import pytest
+import yaml
+
+from config.registry import ConfigRegistry
+from config.schemas import LLMConfig, RetrieverConfig, parse_llm, parse_retriever
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    for name in ("embeddings.yaml", "retriever.yaml", "llm.yaml"):
+        shutil.copy(f"config/{name}", tmp_path / name)
+    return tmp_path
+
+
+def edit_yaml(path, mutate) -> None:
+    """Aplica 'mutate' ao dict do YAML e regrava o arquivo (independe da formatação)."""
+    data = yaml.safe_load(path.read_text())
+    mutate(data)
+    path.write_text(yaml.safe_dump(data))
+
+
+def set_k(path, k: int) -> None:
+    edit_yaml(path, lambda d: d["settings"][d.get("default_type", "similarity")]["search_kwargs"].update(k=k))
+
+
+def test_repo_configs_parse_into_typed_objects(config_dir):
+    registry = ConfigRegistry()
+
+    retriever = registry.get(str(config_dir / "retriever.yaml"))
+    llm = registry.get(str(config_dir / "llm.yaml"))
+    registry.get(str(config_dir / "embeddings.yaml"))
+
+    assert isinstance(retriever, RetrieverConfig)
+    assert retriever.active.search_kwargs["k"] == 3
+    assert isinstance(llm, LLMConfig)
+    assert llm.providers[llm.default_provider].model.max_tokens > 0
+
+
+def test_invalid_retriever_is_rejected():
+    with pytest.raises(ValueError):
+        parse_retriever({"default_type": "similarity", "settings": {"similarity": {"search_type": "similarity", "search_kwargs": {"k": 0}}}})
+
+
+@pytest.mark.parametrize("stub_overrides", [
+    {"latency": {"distribution": "foo"}},
+    {"latency": {"distribution": "constant", "mean_ms": -1}},
+    {"latency": {"min_ms": 100, "max_ms": 10}},
+    {"error_rate": 1.5},
+])
+def test_invalid_stub_provider_is_rejected(stub_overrides):
+    stub = {"model": {"name": "stub", "temperature": 0.0, "max_tokens": 16}, **stub_overrides}
+
+    with pytest.raises(ValueError):
+        parse_llm({"default_provider": "stub", "providers": {"stub": stub}})
+
+
+def test_invalid_file_keeps_previous_config(config_dir):
+    registry = ConfigRegistry()
+    path = config_dir / "retriever.yaml"
+    registry.get(str(path))
+
+    set_k(path, -1)
+
+    assert registry.check_for_changes() == []
+    assert registry.get(str(path)).active.search_kwargs["k"] == 3
+
+
+def test_failed_callback_keeps_previous_config_until_file_changes(config_dir):
+    registry = ConfigRegistry()
+    path = config_dir / "retriever.yaml"
+    calls = []
+
+    class Subscriber:
+        fail = True
+
+        def on_change(self, config):
+            calls.append(config.active.search_kwargs["k"])
+            if self.fail:
+                raise RuntimeError("rebuild failed")
+
+    subscriber = Subscriber()
+    registry.subscribe(str(path), subscriber.on_change)
+    set_k(path, 7)
+
+    assert registry.check_for_changes() == []
+    assert registry.get(str(path)).active.search_kwargs["k"] == 3
+
+    # Mesmo conteúdo: não tenta de novo a cada ciclo.
+    subscriber.fail = False
+    assert registry.check_for_changes() == []
+    assert calls == [7]
+
+    # Arquivo alterado: nova tentativa, agora aplicada.
+    set_k(path, 8)
+    assert len(registry.check_for_changes()) == 1
+    assert registry.get(str(path)).active.search_kwargs["k"] == 8
+    assert calls == [7, 8]
+
+
+def test_subscribers_are_weakly_referenced(config_dir):
+    registry = ConfigRegistry()
+    path = config_dir / "retriever.yaml"
+    calls = []
+
+    class Subscriber:
+        def on_change(self, config):
+            calls.append(config)
+
+    subscriber = Subscriber()
+    registry.subscribe(str(path), subscriber.on_change)
+    del subscriber
+    gc.collect()
+    set_k(path, 5)
+
+    assert len(registry.check_for_changes()) == 1
+    assert calls == []
+
+
+def test_unsubscribe(config_dir):
+    registry = ConfigRegistry()
+    path = config_dir / "retriever.yaml"
+    calls = []
+
+    def on_change(config):
+        calls.append(config)
+
+    registry.subscribe(str(path), on_change)
+    registry.unsubscribe(str(path), on_change)
+    set_k(path, 5)
+
+    assert len(registry.check_for_changes()) == 1
+    assert calls == []
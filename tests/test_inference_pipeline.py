@@ -0,0 +1,85 @@
+import shutil
+
+import pytest
+import yaml
+from langchain_core.documents import Document
+from langchain_core.runnables import RunnableLambda
+
+import config.registry as registry_module
+from config.registry import ConfigRegistry
+from pipelines.inference_pipeline import InferencePipeline
+from src.generation.llm_client import LLMClient
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.retrievers = []
+
+    def as_retriever(self, search_type, search_kwargs):
+        retriever = RunnableLambda(lambda query: [Document(page_content=f"Title: Fake | k={search_kwargs['k']}")])
+        self.retrievers.append((retriever, search_type, search_kwargs))
+        return retriever
+
+
+class FakeChromaClient:
+    """Substitui o ChromaClient: conta quantas vezes o banco de vetores é carregado."""
+
+    def __init__(self):
+        self.load_calls = 0
+        self.vector_store = FakeVectorStore()
+
+    def load_client(self):
+        self.load_calls += 1
+        return self.vector_store
+
+
+def edit_yaml(path, mutate) -> None:
+    data = yaml.safe_load(path.read_text())
+    mutate(data)
+    path.write_text(yaml.safe_dump(data))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Diretório com cópia dos YAMLs, LLM stub sem latência e um registro isolado."""
+    (tmp_path / "config").mkdir()
+    for name in ("embeddings.yaml", "retriever.yaml", "llm.yaml"):
+        shutil.copy(f"config/{name}", tmp_path / "config" / name)
+    edit_yaml(
+        tmp_path / "config" / "llm.yaml",
+        lambda d: d["providers"]["stub"].update(latency={"distribution": "constant", "mean_ms": 0}),
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(registry_module, "_registry", ConfigRegistry())
+    return tmp_path
+
+
+def test_hot_reload_rebuilds_only_retriever_and_llm(workdir):
+    chroma = FakeChromaClient()
+    llm_client = LLMClient(provider="stub")
+    pipeline = InferencePipeline(chroma_client=chroma, llm_client=llm_client)
+
+    pipeline.predict("quero um anime de mistério", session_id="s1")
+    session_store = pipeline.session_store
+    history = session_store["s1"]
+    old_llm = llm_client.llm
+
+    edit_yaml(workdir / "config" / "retriever.yaml", lambda d: d["settings"]["similarity"]["search_kwargs"].update(k=7))
+    edit_yaml(workdir / "config" / "llm.yaml", lambda d: d["providers"]["stub"]["model"].update(temperature=0.9))
+    assert len(registry_module._registry.check_for_changes()) == 2
+
+    # Retriever novo com os parâmetros atualizados, sem recarregar o banco de vetores.
+    retriever, search_type, search_kwargs = chroma.vector_store.retrievers[-1]
+    assert pipeline.retriever is retriever
+    assert search_type == "similarity" and search_kwargs["k"] == 7
+    assert chroma.load_calls == 1
+
+    # LLM reconstruído com a nova configuração.
+    assert llm_client.llm is not old_llm
+    assert llm_client.config.providers["stub"].model.temperature == 0.9
+
+    # Histórico de sessão preservado entre as chains.
+    assert pipeline.session_store is session_store
+    assert pipeline.session_store["s1"] is history
+    pipeline.predict("e algo parecido?", session_id="s1")
+    assert len(history.messages) == 4
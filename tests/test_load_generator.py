@@ -0,0 +1,185 @@
+import json
+import random
+import time
+
+import pytest
+
+from src.generation.stub_llm import StubChatModel, sample_latency
+from src.loadtest.load_generator import LoadGenerator, _percentile
+from src.loadtest.trace import TraceRecorder, load_trace
+from utils.custom_exception import AppException
+
+
+class FakeTarget:
+    """Alvo falso: dorme 'delay' segundos e falha para queries começando com 'fail'."""
+
+    def __init__(self, delay: float = 0.0, in_process: bool = True):
+        self.delay = delay
+        self.in_process = in_process
+
+    def send(self, query: str, session_id: str) -> str:
+        time.sleep(self.delay)
+        if query.startswith("fail-app"):
+            raise AppException("wrapped", ValueError("root cause"))
+        if query.startswith("fail"):
+            raise KeyError(query)
+        return "ok"
+
+
+def _records(queries, step: float = 0.01):
+    return [{"query": q, "session_id": "s", "timestamp": 1000.0 + i * step} for i, q in enumerate(queries)]
+
+
+# --- percentis e agendamento ---
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 11)]
+
+    assert _percentile(values, 50) == 5.0
+    assert _percentile(values, 90) == 9.0
+    assert _percentile(values, 99) == 10.0
+    assert _percentile(values, 0) == 1.0
+    assert _percentile([], 50) == 0.0
+
+
+def test_schedule_uses_timestamps_scaled_by_speedup():
+    generator = LoadGenerator(FakeTarget(), speedup=2.0)
+
+    offsets = [offset for offset, _ in generator._build_schedule(_records(["a", "b", "c"], step=1.0))]
+
+    assert offsets == [0.0, 0.5, 1.0]
+
+
+def test_schedule_with_fixed_rate_ignores_timestamps():
+    generator = LoadGenerator(FakeTarget(), rate=4.0)
+    records = [{"query": q, "session_id": "s", "timestamp": None} for q in "abc"]
+
+    offsets = [offset for offset, _ in generator._build_schedule(records)]
+
+    assert offsets == [0.0, 0.25, 0.5]
+
+
+def test_schedule_without_timestamps_requires_rate():
+    records = [{"query": "a", "session_id": "s", "timestamp": None}]
+
+    with pytest.raises(AppException):
+        LoadGenerator(FakeTarget())._build_schedule(records)
+
+
+# --- relatório ---
+
+def test_report_counts_errors_and_latency():
+    queries = ["ok"] * 6 + ["fail-key", "fail-app"]
+    generator = LoadGenerator(FakeTarget(delay=0.01), rate=200.0, max_workers=4, memory_interval=0.05)
+
+    report = generator.run(_records(queries))
+
+    assert report["requests"] == 8
+    assert report["succeeded"] == 6
+    assert report["failed"] == 2
+    assert report["error_rate"] == pytest.approx(0.25)
+    # AppException é desembrulhada para a causa original.
+    assert report["errors"] == {"KeyError": 1, "ValueError": 1}
+    assert report["service_time_ms"]["p50"] >= 10
+    assert report["latency_ms"]["max"] >= report["service_time_ms"]["max"]
+    assert report["throughput_rps"] > 0
+
+
+def test_queueing_shows_up_in_latency():
+    # 1 worker, requisições a cada 10ms com 50ms de serviço: a fila cresce.
+    generator = LoadGenerator(FakeTarget(delay=0.05), max_workers=1)
+
+    report = generator.run(_records(["ok"] * 5, step=0.01))
+
+    assert report["queue_time_ms"]["max"] > 100
+    assert report["latency_ms"]["p99"] > report["service_time_ms"]["p99"]
+
+
+def test_memory_key_depends_on_target_kind():
+    in_process = LoadGenerator(FakeTarget(), rate=100.0).run(_records(["ok"]))
+    remote = LoadGenerator(FakeTarget(in_process=False), rate=100.0).run(_records(["ok"]))
+
+    assert "memory" in in_process and "client_memory" not in in_process
+    assert "client_memory" in remote and "memory" not in remote
+    assert {"start_mb", "end_mb", "peak_mb", "growth_mb", "timeline"} <= set(in_process["memory"])
+
+
+def test_memory_is_omitted_without_proc(monkeypatch):
+    monkeypatch.setattr("src.loadtest.load_generator._current_rss_mb", lambda: None)
+
+    report = LoadGenerator(FakeTarget(), rate=100.0).run(_records(["ok"]))
+
+    assert "memory" not in report
+
+
+# --- traces ---
+
+def test_load_trace_sorts_and_parses_timestamps(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    lines = [
+        {"query": "second", "session_id": "a", "timestamp": "2026-01-01T00:00:02+00:00"},
+        {"query": "first", "timestamp": 1767225601.0},
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n")
+
+    records = load_trace(str(path))
+
+    assert [r["query"] for r in records] == ["first", "second"]
+    assert records[0]["session_id"] == "default_user"
+    assert records[1]["timestamp"] == pytest.approx(1767225602.0)
+
+
+def test_load_trace_rejects_missing_query(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    path.write_text(json.dumps({"session_id": "a", "timestamp": 1}) + "\n")
+
+    with pytest.raises(AppException):
+        load_trace(str(path))
+
+
+def test_trace_recorder_round_trip(tmp_path):
+    path = tmp_path / "nested" / "trace.jsonl"
+    recorder = TraceRecorder(str(path))
+
+    recorder.record("quero um shonen", "s1", timestamp=10.0)
+    recorder.record("algo como Steins;Gate", "s2", timestamp=5.0)
+
+    records = load_trace(str(path))
+    assert records == [
+        {"query": "algo como Steins;Gate", "session_id": "s2", "timestamp": 5.0},
+        {"query": "quero um shonen", "session_id": "s1", "timestamp": 10.0},
+    ]
+
+
+# --- stub LLM ---
+
+@pytest.mark.parametrize("distribution", ["constant", "uniform", "normal", "lognormal"])
+def test_sample_latency_stays_within_bounds(distribution):
+    conf = {"distribution": distribution, "mean_ms": 100, "stddev_ms": 80, "min_ms": 50, "max_ms": 150}
+    rng = random.Random(0)
+
+    samples = [sample_latency(conf, rng) for _ in range(500)]
+
+    assert all(0.05 <= s <= 0.15 for s in samples)
+
+
+def test_sample_latency_constant_and_clamping():
+    rng = random.Random(0)
+
+    assert sample_latency({"distribution": "constant", "mean_ms": 20}, rng) == pytest.approx(0.02)
+    assert sample_latency({"distribution": "constant", "mean_ms": 500, "max_ms": 100}, rng) == pytest.approx(0.1)
+    assert sample_latency({"distribution": "constant", "mean_ms": 5, "min_ms": 30}, rng) == pytest.approx(0.03)
+
+
+def test_sample_latency_rejects_unknown_distribution():
+    with pytest.raises(ValueError):
+        sample_latency({"distribution": "foo"}, random.Random(0))
+
+
+def test_stub_chat_model_responds_and_injects_errors():
+    ok = StubChatModel(latency={"distribution": "constant", "mean_ms": 0})
+    failing = StubChatModel(latency={"distribution": "constant", "mean_ms": 0}, error_rate=1.0)
+
+    assert ok.invoke("hello").content
+    with pytest.raises(RuntimeError):
+        failing.invoke("hello")
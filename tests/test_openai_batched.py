@@ -0,0 +1,61 @@
+import pytest
+
+from src.embeddings.openai_batched import BatchedOpenAIEmbeddings
+from src.embeddings.stub_server import StubEmbeddingsServer, _fake_vector
+
+
+@pytest.fixture
+def stub_server():
+    server = StubEmbeddingsServer(
+        port=0, latency_ms=20, rate_limit_first=2, retry_after=0.01
+    ).start()
+    yield server
+    server.stop()
+
+
+def _embedder(base_url: str, **kwargs) -> BatchedOpenAIEmbeddings:
+    params = dict(
+        model="text-embedding-3-small",
+        api_key="test",
+        base_url=base_url,
+        dimensions=64,
+        batch_size=5,
+        max_workers=3,
+        max_retries=30,
+        backoff_base=0.01,
+        backoff_max=0.05,
+    )
+    params.update(kwargs)
+    return BatchedOpenAIEmbeddings(**params)
+
+
+def test_embed_documents_against_stub_server(stub_server):
+    texts = [f"anime synopsis number {i}" for i in range(37)]
+    embedder = _embedder(stub_server.base_url)
+
+    vectors = embedder.embed_documents(texts)
+
+    # Ordem preservada: cada vetor corresponde ao texto na mesma posição.
+    assert vectors == [_fake_vector(text, 64) for text in texts]
+    assert all(len(vector) == 64 for vector in vectors)
+    # Houve 429 e, mesmo assim, a chamada terminou com sucesso.
+    assert stub_server.stats["rate_limited"] == 2
+    assert stub_server.stats["max_in_flight"] <= embedder.max_workers
+
+
+def test_oversized_text_is_truncated(stub_server):
+    embedder = _embedder(stub_server.base_url, max_input_tokens=10)
+
+    truncated, n_tokens = embedder._truncate("word " * 500)
+
+    assert n_tokens <= 10
+    assert embedder._count_tokens(truncated) == n_tokens
+    assert len(embedder.embed_documents(["word " * 500])[0]) == 64
+
+
+def test_pack_batches_respects_size_and_token_limits(stub_server):
+    embedder = _embedder(stub_server.base_url, batch_size=3, max_tokens_per_batch=10)
+
+    batches = embedder._pack_batches([4, 4, 4, 1, 1, 1, 1, 20])
+
+    assert batches == [[0, 1], [2, 3, 4], [5, 6], [7]]